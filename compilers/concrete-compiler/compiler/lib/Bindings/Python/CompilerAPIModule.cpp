@@ -2277,6 +2277,9 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
            double encryptionVariance, std::vector<size_t> shape) {
           const std::string &buffer_str = serialized_fheuint;
           std::vector<uint8_t> buffer(buffer_str.begin(), buffer_str.end());
+          // the conversion doesn't touch python objects, so other threads can
+          // import in parallel
+          pybind11::gil_scoped_release release;
           auto arrayRef = llvm::ArrayRef<uint8_t>(buffer);
           auto valueOrError = ::concretelang::clientlib::importTfhersInteger(
               arrayRef, info, encryptionKeyId, encryptionVariance, shape);
@@ -2288,6 +2291,7 @@ void mlir::concretelang::python::populateCompilerAPISubmodule(
 
   m.def("export_tfhers_int", [](TransportValue fheuint,
                                 TfhersFheIntDescription info) {
+    pybind11::gil_scoped_release release;
     auto result = ::concretelang::clientlib::exportTfhersInteger(fheuint, info);
     if (result.has_error()) {
       throw std::runtime_error(result.error().mesg);
@@ -3,15 +3,74 @@ Declaration of `tfhers.Bridge` class.
 """
 
 # pylint: disable=import-error,no-member,no-name-in-module
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from concrete.compiler import LweSecretKey, TfhersExporter, TfhersFheIntDescription
+from concrete.compiler import (
+    LweSecretKey,
+    LweSecretKeyParam,
+    TfhersExporter,
+    TfhersFheIntDescription,
+)
 
 import concrete.fhe as fhe
 from concrete.fhe.compilation.value import Value
 
 from .dtypes import EncryptionKeyChoice, TFHERSIntegerType
 
+# bound once to avoid attribute lookups on every import/export
+_import_int = TfhersExporter.import_int
+_export_int = TfhersExporter.export_int
+
+# zstd level used when compressing serialized values and keys
+_ZSTD_LEVEL = 3
+
+
+def _zstd():
+    try:
+        # pylint: disable=import-outside-toplevel
+        import zstandard
+
+        # pylint: enable=import-outside-toplevel
+    except ImportError as error:  # pragma: no cover
+        if "zstandard" in str(error):
+            message = (
+                "zstd compression requires `full` version of Concrete. "
+                "See https://docs.zama.ai/concrete/getting-started/installing."
+            )
+            raise ImportError(message) from error
+
+        raise
+
+    return zstandard
+
+
+def _compress(buffer: bytes, compress: Optional[str]) -> bytes:
+    if compress is None:
+        return buffer
+    if compress == "zstd":
+        return _zstd().ZstdCompressor(level=_ZSTD_LEVEL).compress(buffer)
+
+    message = f"Unsupported compression '{compress}', expected None or 'zstd'"
+    raise ValueError(message)
+
+
+def _decompress(buffer: bytes, decompress: Optional[str]) -> bytes:
+    if decompress is None:
+        return buffer
+    if decompress == "zstd":
+        return _zstd().ZstdDecompressor().decompress(buffer)
+
+    message = f"Unsupported compression '{decompress}', expected None or 'zstd'"
+    raise ValueError(message)
+
+
+# (type, shape, variance, description) of a tfhers input
+# (key ids are resolved lazily, as they require the execution runtime of the module)
+_InputRow = Tuple[TFHERSIntegerType, Tuple[int, ...], float, TfhersFheIntDescription]
+# (type, shape, description) of a tfhers output
+_OutputRow = Tuple[TFHERSIntegerType, Tuple[int, ...], TfhersFheIntDescription]
+
 
 class Bridge:
     """TFHErs Bridge extend an Module with TFHErs functionalities.
@@ -26,6 +85,19 @@ class Bridge:
         maps every output to a shape for every function in the module. None means a non-tfhers type
     """
 
+    __slots__ = (
+        "module",
+        "default_function",
+        "input_types_per_func",
+        "output_types_per_func",
+        "input_shapes_per_func",
+        "output_shapes_per_func",
+        "_inputs",
+        "_outputs",
+        "_keyid_cache",
+        "_keyset_info_secret_keys",
+    )
+
     module: "fhe.Module"
     default_function: Optional[str]
     input_types_per_func: Dict[str, List[Optional[TFHERSIntegerType]]]
@@ -33,6 +105,15 @@ class Bridge:
     input_shapes_per_func: Dict[str, List[Optional[Tuple[int, ...]]]]
     output_shapes_per_func: Dict[str, List[Optional[Tuple[int, ...]]]]
 
+    # row of every (func_name, input_idx), None means a non-tfhers type
+    _inputs: Dict[Tuple[str, int], Optional[_InputRow]]
+    # row of every (func_name, output_idx), None means a non-tfhers type
+    _outputs: Dict[Tuple[str, int], Optional[_OutputRow]]
+    # key id of every (func_name, input_idx) queried so far
+    _keyid_cache: Dict[Tuple[str, int], int]
+    # parameters of every secret key in the keyset, fetched on first use
+    _keyset_info_secret_keys: Optional[List[LweSecretKeyParam]]
+
     def __init__(
         self,
         module: "fhe.Module",
@@ -40,6 +121,8 @@ class Bridge:
         output_types_per_func: Dict[str, List[Optional[TFHERSIntegerType]]],
         input_shapes_per_func: Dict[str, List[Optional[Tuple[int, ...]]]],
         output_shapes_per_func: Dict[str, List[Optional[Tuple[int, ...]]]],
+        input_descs_per_func: Optional[Dict[str, List[Optional[TfhersFheIntDescription]]]] = None,
+        output_descs_per_func: Optional[Dict[str, List[Optional[TfhersFheIntDescription]]]] = None,
     ):
         if module.function_count == 1:
             self.default_function = next(iter(module.graphs.keys()))
@@ -51,6 +134,47 @@ class Bridge:
         self.input_shapes_per_func = input_shapes_per_func
         self.output_shapes_per_func = output_shapes_per_func
 
+        # descriptions are only stored in the rows below
+        if input_descs_per_func is None:
+            input_descs_per_func = self._descriptions_per_func(input_types_per_func)
+        if output_descs_per_func is None:
+            output_descs_per_func = self._descriptions_per_func(output_types_per_func)
+
+        self._keyid_cache = {}
+        self._keyset_info_secret_keys = None
+
+        self._inputs = {
+            (func_name, input_idx): (
+                (
+                    input_type,
+                    input_shape,
+                    input_type.params.encryption_variance(),
+                    input_desc,
+                )
+                if input_type is not None and input_shape is not None and input_desc is not None
+                else None
+            )
+            for func_name, input_types in input_types_per_func.items()
+            for input_idx, (input_type, input_shape, input_desc) in enumerate(
+                zip(input_types, input_shapes_per_func[func_name], input_descs_per_func[func_name])
+            )
+        }
+        self._outputs = {
+            (func_name, output_idx): (
+                (output_type, output_shape, output_desc)
+                if output_type is not None and output_shape is not None and output_desc is not None
+                else None
+            )
+            for func_name, output_types in output_types_per_func.items()
+            for output_idx, (output_type, output_shape, output_desc) in enumerate(
+                zip(
+                    output_types,
+                    output_shapes_per_func[func_name],
+                    output_descs_per_func[func_name],
+                )
+            )
+        }
+
     def _get_default_func_or_raise_error(self, calling_func: str) -> str:
         if self.default_function is not None:
             return self.default_function
@@ -60,65 +184,26 @@ class Bridge:
                 f"calling '{calling_func}'"
             )
 
-    def _input_type(self, func_name: str, input_idx: int) -> Optional[TFHERSIntegerType]:
-        """Return the type of a certain input.
-
-        Args:
-            func_name (str): name of the function the input belongs to
-            input_idx (int): the input index to get the type of
-
-        Returns:
-            Optional[TFHERSIntegerType]: input type. None means a non-tfhers type
-        """
-        return self.input_types_per_func[func_name][input_idx]
-
-    def _output_type(self, func_name: str, output_idx: int) -> Optional[TFHERSIntegerType]:
-        """Return the type of a certain output.
-
-        Args:
-            func_name (str): name of the function the output belongs to
-            output_idx (int): the output index to get the type of
-
-        Returns:
-            Optional[TFHERSIntegerType]: output type. None means a non-tfhers type
-        """
-        return self.output_types_per_func[func_name][output_idx]
-
-    def _input_shape(self, func_name: str, input_idx: int) -> Optional[Tuple[int, ...]]:
-        """Return the shape of a certain input.
-
-        Args:
-            func_name (str): name of the function the input belongs to
-            input_idx (int): the input index to get the shape of
-
-        Returns:
-            Optional[Tuple[int, ...]]: input shape. None means a non-tfhers type
-        """
-        return self.input_shapes_per_func[func_name][input_idx]
-
-    def _output_shape(
-        self, func_name: str, output_idx: int
-    ) -> Optional[Tuple[int, ...]]:  # pragma: no cover
-        """Return the shape of a certain output.
-
-        Args:
-            func_name (str): name of the function the output belongs to
-            output_idx (int): the output index to get the shape of
-
-        Returns:
-            Optional[Tuple[int, ...]]: output shape. None means a non-tfhers type
-        """
-        return self.output_shapes_per_func[func_name][output_idx]
+    def _invalid_index_message(self, kind: str, func_name: str, idx: int) -> str:
+        if func_name not in self.input_types_per_func:
+            return f"Module doesn't contain a function named '{func_name}'"
+        return f"Function '{func_name}' doesn't have an {kind} at index {idx}"
 
     def _input_keyid(self, func_name: str, input_idx: int) -> int:
-        return self.module.client.specs.program_info.input_keyid_at(input_idx, func_name)
-
-    def _input_variance(self, func_name: str, input_idx: int) -> float:
-        input_type = self._input_type(func_name, input_idx)
-        if input_type is None:  # pragma: no cover
-            msg = "input at 'input_idx' is not a TFHErs value"
-            raise ValueError(msg)
-        return input_type.params.encryption_variance()
+        key = (func_name, input_idx)
+        keyid = self._keyid_cache.get(key)
+        if keyid is None:
+            if key not in self._inputs:
+                raise ValueError(self._invalid_index_message("input", func_name, input_idx))
+            keyid = self.module.client.specs.program_info.input_keyid_at(input_idx, func_name)
+            self._keyid_cache[key] = keyid
+        return keyid
+
+    def _secret_key_params(self) -> List[LweSecretKeyParam]:
+        if self._keyset_info_secret_keys is None:
+            keyset_info = self.module.client.specs.program_info.get_keyset_info()
+            self._keyset_info_secret_keys = keyset_info.secret_keys()
+        return self._keyset_info_secret_keys
 
     @staticmethod
     def _description_from_type(
@@ -129,10 +214,11 @@ class Bridge:
         bit_width = tfhers_int_type.bit_width
         signed = tfhers_int_type.is_signed
         params = tfhers_int_type.params
-        message_modulus = 2**tfhers_int_type.msg_width
-        carry_modulus = 2**tfhers_int_type.carry_width
+        msg_width = tfhers_int_type.msg_width
+        message_modulus = 1 << msg_width
+        carry_modulus = 1 << tfhers_int_type.carry_width
         lwe_size = params.polynomial_size + 1
-        n_cts = bit_width // tfhers_int_type.msg_width
+        n_cts = bit_width // msg_width
         ks_first = params.encryption_key_choice is EncryptionKeyChoice.BIG
         # maximum value using message bits as we don't use carry bits here
         degree = message_modulus - 1
@@ -151,7 +237,65 @@ class Bridge:
             ks_first,
         )
 
-    def import_value(self, buffer: bytes, input_idx: int, func_name: Optional[str] = None) -> Value:
+    @staticmethod
+    def _descriptions_per_func(
+        types_per_func: Dict[str, List[Optional[TFHERSIntegerType]]],
+    ) -> Dict[str, List[Optional[TfhersFheIntDescription]]]:
+        """Construct the TFHErs integer description of every type, for every function."""
+
+        return {
+            func_name: [
+                Bridge._description_from_type(tfhers_type) if tfhers_type is not None else None
+                for tfhers_type in types
+            ]
+            for func_name, types in types_per_func.items()
+        }
+
+    def _input_row(self, func_name: str, input_idx: int) -> _InputRow:
+        """Return the precomputed row of a certain tfhers input.
+
+        Args:
+            func_name (str): name of the function the input belongs to
+            input_idx (int): the input index to get the row of
+
+        Returns:
+            _InputRow: type, shape, variance, and description of the input
+        """
+        try:
+            input_row = self._inputs[func_name, input_idx]
+        except KeyError:
+            raise ValueError(self._invalid_index_message("input", func_name, input_idx)) from None
+        if input_row is None:  # pragma: no cover
+            msg = "input at 'input_idx' is not a TFHErs value"
+            raise ValueError(msg)
+        return input_row
+
+    def _output_row(self, func_name: str, output_idx: int) -> _OutputRow:
+        """Return the precomputed row of a certain tfhers output.
+
+        Args:
+            func_name (str): name of the function the output belongs to
+            output_idx (int): the output index to get the row of
+
+        Returns:
+            _OutputRow: type, shape, and description of the output
+        """
+        try:
+            output_row = self._outputs[func_name, output_idx]
+        except KeyError:
+            raise ValueError(self._invalid_index_message("output", func_name, output_idx)) from None
+        if output_row is None:  # pragma: no cover
+            msg = "output at 'output_idx' is not a TFHErs value"
+            raise ValueError(msg)
+        return output_row
+
+    def import_value(
+        self,
+        buffer: bytes,
+        input_idx: int,
+        func_name: Optional[str] = None,
+        decompress: Optional[str] = None,
+    ) -> Value:
         """Import a serialized TFHErs integer as a Value.
 
         Args:
@@ -159,6 +303,8 @@ class Bridge:
             input_idx (int): the index of the input expecting this value
             func_name (Optional[str]): name of the function the value belongs to.
                 Doesn't need to be provided if there is a single function.
+            decompress (Optional[str], default = None): compression used on `buffer`.
+                Either None (uncompressed) or "zstd".
 
         Returns:
             fhe.TransportValue: imported value
@@ -166,18 +312,98 @@ class Bridge:
         if func_name is None:
             func_name = self._get_default_func_or_raise_error("import_value")
 
-        input_type = self._input_type(func_name, input_idx)
-        input_shape = self._input_shape(func_name, input_idx)
-        if input_type is None or input_shape is None:  # pragma: no cover
-            msg = "input at 'input_idx' is not a TFHErs value"
-            raise ValueError(msg)
+        _, input_shape, variance, fheint_desc = self._input_row(func_name, input_idx)
+        buffer = _decompress(buffer, decompress)
+        keyid = self._input_keyid(func_name, input_idx)
+        return Value(_import_int(buffer, fheint_desc, keyid, variance, input_shape))
+
+    def import_values(
+        self,
+        buffers: Sequence[bytes],
+        input_idx: int,
+        func_name: Optional[str] = None,
+        decompress: Optional[str] = None,
+    ) -> List[Value]:
+        """Import several serialized TFHErs integers as Values for the same input.
+
+        Args:
+            buffers (Sequence[bytes]): serialized integers
+            input_idx (int): the index of the input expecting these values
+            func_name (Optional[str]): name of the function the values belong to.
+                Doesn't need to be provided if there is a single function.
+            decompress (Optional[str], default = None): compression used on `buffers`.
+                Either None (uncompressed) or "zstd".
 
-        fheint_desc = self._description_from_type(input_type)
+        Returns:
+            List[fhe.TransportValue]: imported values, in the same order as `buffers`
+        """
+        if func_name is None:
+            func_name = self._get_default_func_or_raise_error("import_values")
+
+        _, input_shape, variance, fheint_desc = self._input_row(func_name, input_idx)
         keyid = self._input_keyid(func_name, input_idx)
-        variance = self._input_variance(func_name, input_idx)
-        return Value(TfhersExporter.import_int(buffer, fheint_desc, keyid, variance, input_shape))
+        return [
+            Value(
+                _import_int(
+                    _decompress(buffer, decompress), fheint_desc, keyid, variance, input_shape
+                )
+            )
+            for buffer in buffers
+        ]
+
+    def import_values_parallel(
+        self,
+        buffers: Sequence[bytes],
+        input_idx: int,
+        func_name: Optional[str] = None,
+        workers: Optional[int] = None,
+        decompress: Optional[str] = None,
+    ) -> List[Value]:
+        """Import several serialized TFHErs integers as Values for the same input, in parallel.
+
+        The conversion releases the GIL, so buffers are imported concurrently on a thread pool.
 
-    def export_value(self, value: Value, output_idx: int, func_name: Optional[str] = None) -> bytes:
+        Args:
+            buffers (Sequence[bytes]): serialized integers
+            input_idx (int): the index of the input expecting these values
+            func_name (Optional[str]): name of the function the values belong to.
+                Doesn't need to be provided if there is a single function.
+            workers (Optional[int], default = None): maximum number of threads to use.
+                Defaults to the `ThreadPoolExecutor` default.
+            decompress (Optional[str], default = None): compression used on `buffers`.
+                Either None (uncompressed) or "zstd".
+
+        Returns:
+            List[fhe.TransportValue]: imported values, in the same order as `buffers`
+        """
+        if func_name is None:
+            func_name = self._get_default_func_or_raise_error("import_values_parallel")
+
+        _, input_shape, variance, fheint_desc = self._input_row(func_name, input_idx)
+        keyid = self._input_keyid(func_name, input_idx)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda buffer: Value(
+                        _import_int(
+                            _decompress(buffer, decompress),
+                            fheint_desc,
+                            keyid,
+                            variance,
+                            input_shape,
+                        )
+                    ),
+                    buffers,
+                )
+            )
+
+    def export_value(
+        self,
+        value: Value,
+        output_idx: int,
+        func_name: Optional[str] = None,
+        compress: Optional[str] = None,
+    ) -> bytes:
         """Export a value as a serialized TFHErs integer.
 
         Args:
@@ -185,6 +411,8 @@ class Bridge:
             output_idx (int): the index corresponding to this output
             func_name (Optional[str]): name of the function the value belongs to.
                 Doesn't need to be provided if there is a single function.
+            compress (Optional[str], default = None): compression to apply on the result.
+                Either None (uncompressed) or "zstd".
 
         Returns:
             bytes: serialized fheuint8
@@ -192,23 +420,95 @@ class Bridge:
         if func_name is None:
             func_name = self._get_default_func_or_raise_error("export_value")
 
-        output_type = self._output_type(func_name, output_idx)
-        if output_type is None:  # pragma: no cover
-            msg = "output at 'output_idx' is not a TFHErs value"
-            raise ValueError(msg)
+        _, _, fheint_desc = self._output_row(func_name, output_idx)
+        buffer = _export_int(value._inner, fheint_desc)  # pylint: disable=protected-access
+        return _compress(buffer, compress)
 
-        fheint_desc = self._description_from_type(output_type)
-        return TfhersExporter.export_int(
-            value._inner, fheint_desc  # pylint: disable=protected-access
-        )
+    def export_values(
+        self,
+        values: Sequence[Value],
+        output_idx: int,
+        func_name: Optional[str] = None,
+        compress: Optional[str] = None,
+    ) -> List[bytes]:
+        """Export several values of the same output as serialized TFHErs integers.
+
+        Args:
+            values (Sequence[TransportValue]): values to export
+            output_idx (int): the index corresponding to these outputs
+            func_name (Optional[str]): name of the function the values belong to.
+                Doesn't need to be provided if there is a single function.
+            compress (Optional[str], default = None): compression to apply on the results.
+                Either None (uncompressed) or "zstd".
+
+        Returns:
+            List[bytes]: serialized integers, in the same order as `values`
+        """
+        if func_name is None:
+            func_name = self._get_default_func_or_raise_error("export_values")
+
+        _, _, fheint_desc = self._output_row(func_name, output_idx)
+        return [
+            _compress(
+                _export_int(value._inner, fheint_desc), compress  # pylint: disable=protected-access
+            )
+            for value in values
+        ]
 
-    def serialize_input_secret_key(self, input_idx: int, func_name: Optional[str] = None) -> bytes:
+    def export_values_parallel(
+        self,
+        values: Sequence[Value],
+        output_idx: int,
+        func_name: Optional[str] = None,
+        workers: Optional[int] = None,
+        compress: Optional[str] = None,
+    ) -> List[bytes]:
+        """Export several values of the same output as serialized TFHErs integers, in parallel.
+
+        The conversion releases the GIL, so values are exported concurrently on a thread pool.
+
+        Args:
+            values (Sequence[TransportValue]): values to export
+            output_idx (int): the index corresponding to these outputs
+            func_name (Optional[str]): name of the function the values belong to.
+                Doesn't need to be provided if there is a single function.
+            workers (Optional[int], default = None): maximum number of threads to use.
+                Defaults to the `ThreadPoolExecutor` default.
+            compress (Optional[str], default = None): compression to apply on the results.
+                Either None (uncompressed) or "zstd".
+
+        Returns:
+            List[bytes]: serialized integers, in the same order as `values`
+        """
+        if func_name is None:
+            func_name = self._get_default_func_or_raise_error("export_values_parallel")
+
+        _, _, fheint_desc = self._output_row(func_name, output_idx)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(
+                    lambda value: _compress(
+                        _export_int(value._inner, fheint_desc),  # pylint: disable=protected-access
+                        compress,
+                    ),
+                    values,
+                )
+            )
+
+    def serialize_input_secret_key(
+        self,
+        input_idx: int,
+        func_name: Optional[str] = None,
+        compress: Optional[str] = None,
+    ) -> bytes:
         """Serialize secret key used for a specific input.
 
         Args:
             input_idx (int): input index corresponding to the key to serialize
             func_name (Optional[str]): name of the function the key belongs to.
                 Doesn't need to be provided if there is a single function.
+            compress (Optional[str], default = None): compression to apply on the result.
+                Either None (uncompressed) or "zstd".
 
         Returns:
             bytes: serialized key
@@ -222,7 +522,7 @@ class Bridge:
         assert keys is not None
         secret_key = keys._keyset.get_client_keys().get_secret_keys()[keyid]  # type: ignore
         # pylint: enable=protected-access
-        return secret_key.serialize()
+        return _compress(secret_key.serialize(), compress)
 
     def keygen_with_initial_keys(
         self,
@@ -253,27 +553,32 @@ class Bridge:
             RuntimeError: if failed to deserialize the key
         """
         initial_keys: Dict[int, LweSecretKey] = {}
-        for idx in input_idx_to_key_buffer:
+        secret_key_params = self._secret_key_params()
+        default_function = self.default_function
+        input_keyid = self._input_keyid
+        for idx, key_buffer in input_idx_to_key_buffer.items():
             if isinstance(idx, tuple):
                 func_name, input_idx = idx
-            elif isinstance(idx, int) and self.default_function is not None:
+            elif isinstance(idx, int) and default_function is not None:
                 input_idx = idx
-                func_name = self.default_function
+                func_name = default_function
             else:
                 raise RuntimeError(
                     "Module contains more than one function, so please make sure to mention "
                     "the function name (not just the position) in input_idx_to_key_buffer. "
                     "An example index would be a tuple ('my_func', 1)."
                 )
-            key_id = self._input_keyid(func_name, input_idx)
+            key_id = input_keyid(func_name, input_idx)
             # no need to deserialize the same key again
+            # (keys are deduplicated by id and not by content, as a deserialized key carries
+            # the info of the key id it was deserialized for, so it can't be shared across ids)
             if key_id in initial_keys:  # pragma: no cover
                 continue
 
-            key_buffer = input_idx_to_key_buffer[idx]
-            param = self.module.client.specs.program_info.get_keyset_info().secret_keys()[key_id]
             try:
-                initial_keys[key_id] = LweSecretKey.deserialize(key_buffer, param)
+                initial_keys[key_id] = LweSecretKey.deserialize(
+                    key_buffer, secret_key_params[key_id]
+                )
             except Exception as e:  # pragma: no cover
                 msg = (
                     f"failed deserializing key for input with index {idx}. Make sure the key"
@@ -310,36 +615,41 @@ def new_bridge(circuit_or_module: Union["fhe.Circuit", "fhe.Module"]) -> Bridge:
     output_shapes_per_func = {}
 
     for func_name, graph in module.graphs.items():
-        input_types: List[Optional[TFHERSIntegerType]] = []
-        input_shapes: List[Optional[Tuple[int, ...]]] = []
-        for input_node in graph.ordered_inputs():
-            if isinstance(input_node.output.dtype, TFHERSIntegerType):
-                input_types.append(input_node.output.dtype)
-                input_shapes.append(input_node.output.shape)
-            else:
-                input_types.append(None)
-                input_shapes.append(None)
+        inputs = [(node.output.dtype, node.output.shape) for node in graph.ordered_inputs()]
+        input_types: List[Optional[TFHERSIntegerType]] = [
+            dtype if isinstance(dtype, TFHERSIntegerType) else None for dtype, _ in inputs
+        ]
+        input_shapes: List[Optional[Tuple[int, ...]]] = [
+            shape if input_type is not None else None
+            for input_type, (_, shape) in zip(input_types, inputs)
+        ]
 
         input_types_per_func[func_name] = input_types
         input_shapes_per_func[func_name] = input_shapes
 
-        output_types: List[Optional[TFHERSIntegerType]] = []
-        output_shapes: List[Optional[Tuple[int, ...]]] = []
-        for output_node in graph.ordered_outputs():
-            if isinstance(output_node.output.dtype, TFHERSIntegerType):
-                output_types.append(output_node.output.dtype)
-                output_shapes.append(output_node.output.shape)
-            else:  # pragma: no cover
-                output_types.append(None)
-                output_shapes.append(None)
+        outputs = [(node.output.dtype, node.output.shape) for node in graph.ordered_outputs()]
+        output_types: List[Optional[TFHERSIntegerType]] = [
+            dtype if isinstance(dtype, TFHERSIntegerType) else None for dtype, _ in outputs
+        ]
+        output_shapes: List[Optional[Tuple[int, ...]]] = [
+            shape if output_type is not None else None
+            for output_type, (_, shape) in zip(output_types, outputs)
+        ]
 
         output_types_per_func[func_name] = output_types
         output_shapes_per_func[func_name] = output_shapes
 
+    # pylint: disable=protected-access
+    input_descs_per_func = Bridge._descriptions_per_func(input_types_per_func)
+    output_descs_per_func = Bridge._descriptions_per_func(output_types_per_func)
+    # pylint: enable=protected-access
+
     return Bridge(
         module,
         input_types_per_func,
         output_types_per_func,
         input_shapes_per_func,
         output_shapes_per_func,
+        input_descs_per_func,
+        output_descs_per_func,
     )
@@ -9,6 +9,7 @@ from typing import List, Union
 
 import numpy as np
 import pytest
+import zstandard
 
 import concrete.fhe as fhe
 from concrete.fhe import tfhers
@@ -482,6 +483,11 @@ def test_tfhers_binary_encrypted_complete_circuit_concrete_keygen(
     with open(key_path, "wb") as fw:
         fw.write(serialized_key)
 
+    compressed_key = tfhers_bridge.serialize_input_secret_key(input_idx=0, compress="zstd")
+    assert zstandard.ZstdDecompressor().decompress(compressed_key) == serialized_key
+    with pytest.raises(ValueError, match="Unsupported compression 'gzip'"):
+        tfhers_bridge.serialize_input_secret_key(input_idx=0, compress="gzip")
+
     ct1, ct2 = sample
     _, ct1_path = tempfile.mkstemp()
     _, ct2_path = tempfile.mkstemp()
@@ -574,6 +580,29 @@ def test_tfhers_binary_encrypted_complete_circuit_concrete_keygen(
     os.remove(ct1_path)
     os.remove(ct2_path)
 
+    # bridges created without descriptions should derive them from the types
+    direct_bridge = tfhers.bridge.Bridge(
+        circuit._module,  # pylint: disable=protected-access
+        tfhers_bridge.input_types_per_func,
+        tfhers_bridge.output_types_per_func,
+        tfhers_bridge.input_shapes_per_func,
+        tfhers_bridge.output_shapes_per_func,
+    )
+    assert direct_bridge.import_value(buff, 1).serialize() == cts[1].serialize()
+
+    # batched import should match individual imports
+    batched_cts = tfhers_bridge.import_values([buff, buff], 1)
+    assert [ct.serialize() for ct in batched_cts] == [cts[1].serialize()] * 2
+    parallel_cts = tfhers_bridge.import_values_parallel([buff, buff], 1, workers=2)
+    assert [ct.serialize() for ct in parallel_cts] == [cts[1].serialize()] * 2
+
+    # compressed import should match uncompressed import
+    compressed_buff = zstandard.ZstdCompressor().compress(buff)
+    decompressed_ct = tfhers_bridge.import_value(compressed_buff, 1, decompress="zstd")
+    assert decompressed_ct.serialize() == cts[1].serialize()
+    with pytest.raises(ValueError, match="Unsupported compression 'gzip'"):
+        tfhers_bridge.import_value(compressed_buff, 1, decompress="gzip")
+
     tfhers_encrypted_result = circuit.run(*cts)
 
     # concrete decryption should work
@@ -584,6 +613,37 @@ def test_tfhers_binary_encrypted_complete_circuit_concrete_keygen(
 
     # tfhers decryption
     buff = tfhers_bridge.export_value(tfhers_encrypted_result, output_idx=0)  # type: ignore
+    batched_buffs = tfhers_bridge.export_values([tfhers_encrypted_result], 0)  # type: ignore
+    assert batched_buffs == [buff]
+    parallel_buffs = tfhers_bridge.export_values_parallel(
+        [tfhers_encrypted_result] * 2, 0, workers=2  # type: ignore
+    )
+    assert parallel_buffs == [buff] * 2
+    compressed_buff = tfhers_bridge.export_value(
+        tfhers_encrypted_result, output_idx=0, compress="zstd"  # type: ignore
+    )
+    assert zstandard.ZstdDecompressor().decompress(compressed_buff) == buff
+
+    # the output has the same type and shape as the inputs, so it can be imported back
+    reimported_ct = tfhers_bridge.import_value(buff, 0)
+    decompressed_ct = tfhers_bridge.import_value(compressed_buff, 0, decompress="zstd")
+    assert decompressed_ct.serialize() == reimported_ct.serialize()
+
+    compressed_buffs = tfhers_bridge.export_values(
+        [tfhers_encrypted_result], 0, compress="zstd"  # type: ignore
+    )
+    assert compressed_buffs == [compressed_buff]
+    parallel_compressed_buffs = tfhers_bridge.export_values_parallel(
+        [tfhers_encrypted_result] * 2, 0, workers=2, compress="zstd"  # type: ignore
+    )
+    assert parallel_compressed_buffs == [compressed_buff] * 2
+    decompressed_cts = tfhers_bridge.import_values(compressed_buffs, 0, decompress="zstd")
+    assert [ct.serialize() for ct in decompressed_cts] == [reimported_ct.serialize()]
+    parallel_decompressed_cts = tfhers_bridge.import_values_parallel(
+        parallel_compressed_buffs, 0, workers=2, decompress="zstd"
+    )
+    assert [ct.serialize() for ct in parallel_decompressed_cts] == [reimported_ct.serialize()] * 2
+
     _, ct_out_path = tempfile.mkstemp()
     _, pt_path = tempfile.mkstemp()
     with open(ct_out_path, "wb") as fw:
@@ -1281,6 +1341,19 @@ def test_tfhers_binary_encrypted_complete_circuit_tfhers_keygen_with_modules(
         with pytest.raises(RuntimeError, match="Module contains more than one function"):
             buff = tfhers_bridge.export_value(tfhers_encrypted_result, output_idx=0)  # type: ignore
         buff = tfhers_bridge.export_value(tfhers_encrypted_result, output_idx=0, func_name="add")  # type: ignore
+
+    # unknown functions and out of range indices are reported
+    with pytest.raises(ValueError, match="Module doesn't contain a function named 'unknown'"):
+        tfhers_bridge.import_value(buff, 0, func_name="unknown")
+    with pytest.raises(ValueError, match="Function 'add' doesn't have an input at index 2"):
+        tfhers_bridge.import_values([buff], 2, func_name="add")
+    with pytest.raises(ValueError, match="Function 'add' doesn't have an output at index 1"):
+        tfhers_bridge.export_value(tfhers_encrypted_result, 1, func_name="add")  # type: ignore
+    with pytest.raises(ValueError, match="Module doesn't contain a function named 'unknown'"):
+        tfhers_bridge.export_values([tfhers_encrypted_result], 0, func_name="unknown")  # type: ignore
+    with pytest.raises(ValueError, match="Function 'add' doesn't have an input at index 2"):
+        tfhers_bridge.serialize_input_secret_key(2, func_name="add")
+
     _, ct_out_path = tempfile.mkstemp()
     _, pt_path = tempfile.mkstemp()
     with open(ct_out_path, "wb") as f: